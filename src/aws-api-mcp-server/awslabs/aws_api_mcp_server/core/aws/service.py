@@ -14,7 +14,7 @@
 
 import contextlib
 import json
-from ..aws.services import driver
+from ..aws.services import get_driver
 from ..common.config import AWS_API_MCP_PROFILE_NAME, DEFAULT_REGION
 from ..common.errors import AwsApiMcpError, Failure
 from ..common.models import (
@@ -85,7 +85,7 @@ def is_operation_read_only(ir: IRTranslation, read_only_operations: ReadOnlyOper
 
     service_name = ir.command_metadata.service_sdk_name
     operation_name = ir.command_metadata.operation_sdk_name
-    return read_only_operations.has(service=service_name, operation=operation_name)
+    return read_only_operations.has(service_name, operation_name)
 
 
 def check_security_policy(
@@ -94,7 +94,7 @@ def check_security_policy(
     """Check security policy for the given command and return decision."""
 
     def is_read_only_func(service: str, operation: str) -> bool:
-        return read_only_operations.has(service=service, operation=operation)
+        return read_only_operations.has(service, operation)
 
     policy = SecurityPolicy(ctx)
 
@@ -121,8 +121,8 @@ def check_security_policy(
 def validate(ir: IRTranslation) -> ProgramValidationResponse:
     """Translate the given CLI command and return a validation response."""
     return ProgramValidationResponse(
-        missing_context_failures=_to_missing_context_failures(ir.missing_context_failures),
-        validation_failures=_to_validation_failures(ir.validation_or_translation_failures),
+        missing_context_failures=_to_failures(ir.missing_context_failures),
+        validation_failures=_to_failures(ir.validation_or_translation_failures),
     )
 
 
@@ -149,7 +149,7 @@ def execute_awscli_customization(
                 ir_command.operation_name,
                 ir_command.region or DEFAULT_REGION,
             ):
-                driver.main(args)
+                get_driver().main(args)
 
         stdout_output = stdout_capture.getvalue()
         stderr_output = stderr_capture.getvalue()
@@ -204,8 +204,8 @@ def interpret_command(
     return ProgramInterpretationResponse(
         response=response,
         metadata=_ir_metadata(interpreted_program),
-        validation_failures=_to_validation_failures(validation_failures),
-        missing_context_failures=_to_missing_context_failures(missing_context_failures),
+        validation_failures=_to_failures(validation_failures),
+        missing_context_failures=_to_failures(missing_context_failures),
         failed_constraints=failed_constraints,
     )
 
@@ -230,19 +230,7 @@ def _ir_metadata(program: InterpretedProgram | None) -> InterpretationMetadata |
     return None
 
 
-def _to_missing_context_failures(
-    failures: list[Failure] | None,
-) -> list[FailureAPIModel] | None:
-    if not failures:
-        return None
-
-    return [
-        FailureAPIModel(reason=failure.reason, context=_to_context(failure.context))
-        for failure in failures
-    ]
-
-
-def _to_validation_failures(failures: list[Failure] | None) -> list[FailureAPIModel] | None:
+def _to_failures(failures: list[Failure] | None) -> list[FailureAPIModel] | None:
     if not failures:
         return None
 
@@ -13,12 +13,17 @@
 # limitations under the License.
 
 import awscli.clidriver
+import html
 import re
+import threading
 from awscli.paramfile import LOCAL_PREFIX_MAP, URIArgumentHandler
 from botocore.model import OperationModel
-from collections.abc import Set
+from botocore.regions import EndpointResolver
+from botocore.session import Session
+from collections.abc import Iterable, Iterator, Set
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from loguru import logger
-from lxml import html
 from typing import Any, NamedTuple
 
 
@@ -46,10 +51,33 @@ class ConfigResult(NamedTuple):
 
 
 filter_query = re.compile(r'^\s+([-a-z0-9_.]+|tag:<key>)\s+')
+list_tag_query = re.compile(r'<(/?)(ul|li)>')
+html_tag_query = re.compile(r'<[^>]+>')
 
-driver = awscli.clidriver.create_clidriver()
-session = driver.session
-session.register('load-cli-arg', RESTRICTED_URI_HANDLER)
+
+_driver: awscli.clidriver.CLIDriver | None = None
+_driver_lock = threading.Lock()
+
+
+def get_driver() -> awscli.clidriver.CLIDriver:
+    """Return the AWS CLI driver, creating it on first use."""
+    global _driver
+    if _driver is not None:
+        return _driver
+
+    # Locked so that concurrent first calls cannot create several drivers
+    with _driver_lock:
+        if _driver is None:
+            driver = awscli.clidriver.create_clidriver()
+            driver.session.register('load-cli-arg', RESTRICTED_URI_HANDLER)
+            # Published only once complete, since other threads read it without the lock
+            _driver = driver
+        return _driver
+
+
+def get_session() -> Session:
+    """Return the botocore session of the AWS CLI driver."""
+    return get_driver().session
 
 
 class OperationFilters:
@@ -66,6 +94,11 @@ class OperationFilters:
         """Return the set of filter keys."""
         return self._filter_keys
 
+    @property
+    def filter_set(self) -> frozenset[str]:
+        """Return the set of filter names known from the documentation."""
+        return self._filter_set
+
     def allows_filter(self, filter_name: str) -> bool:
         """Check if the given filter name is allowed."""
         if not self._filter_set:
@@ -126,8 +159,55 @@ CUSTOM_OPERATION_FILTERS = {
 }
 
 
+# Services with the most operations taking documented filters, warmed up at server start
+OPERATION_FILTERS_WARMUP_SERVICES = ('ec2', 'rds', 'ssm')
+
+_operation_filters_cache: dict[tuple[str, str], OperationFilters] = {}
+# Operations whose documented filters are empty and have not been warned about yet
+_unreported_empty_filter_sets: set[tuple[str, str]] = set()
+
+
 def get_operation_filters(operation: OperationModel) -> OperationFilters:
     """Given an operation, find all its filters."""
+    key = (operation.service_model.service_name, operation.name)
+    operation_filters = _operation_filters_cache.get(key)
+    if operation_filters is None:
+        operation_filters = _build_operation_filters(operation)
+        _operation_filters_cache[key] = operation_filters
+
+    # Warn the first time a request needs the filters, rather than when they are built
+    try:
+        _unreported_empty_filter_sets.remove(key)
+    except KeyError:
+        pass
+    else:
+        logger.warning(
+            f'Empty filter set for {operation.service_model.service_name}:{operation.name}. '
+            'Filter validation is likely to fail'
+        )
+    return operation_filters
+
+
+def warmup_operation_filters(service_names: Iterable[str], max_workers: int = 8):
+    """Precompute the filters of every operation of the given services."""
+
+    def warmup_service(service_name: str):
+        # botocore sessions are not thread safe, so each worker loads the model on its own session
+        service_model = Session().get_service_model(service_name)
+        for operation_name in service_model.operation_names:
+            operation = service_model.operation_model(operation_name)
+            if operation.input_shape is not None:
+                # Bypass get_operation_filters so empty filter sets are only reported on requests
+                _operation_filters_cache.setdefault(
+                    (service_name, operation.name), _build_operation_filters(operation)
+                )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the results so that errors from the workers are raised here
+        list(executor.map(warmup_service, service_names))
+
+
+def _build_operation_filters(operation: OperationModel) -> OperationFilters:
     filters = operation.input_shape._shape_model.get('members', {}).get('Filters')  # type: ignore[attr-defined]
 
     if not filters or 'documentation' not in filters:
@@ -151,8 +231,8 @@ def get_operation_filters(operation: OperationModel) -> OperationFilters:
     filter_documentation = filters['documentation']
     filter_set = set()
     allows_tag_key = False
-    for list_item in html.fromstring(filter_documentation).xpath('ul/li'):
-        matched = filter_query.search(list_item.text_content())
+    for list_item in _top_level_list_items(filter_documentation):
+        matched = filter_query.search(list_item)
         if matched is not None:
             filter_name = matched.group(1)
             if filter_name == 'tag:<key>':
@@ -160,13 +240,31 @@ def get_operation_filters(operation: OperationModel) -> OperationFilters:
             else:
                 filter_set.add(filter_name)
     if not filter_set:
-        logger.warning(
-            f'Empty filter set for {operation.service_model.service_name}:{operation.name}. '
-            'Filter validation is likely to fail'
-        )
+        _unreported_empty_filter_sets.add((operation.service_model.service_name, operation.name))
     return OperationFilters(filter_keys, filter_set, allows_tag_key)
 
 
+def _top_level_list_items(documentation: str) -> Iterator[str]:
+    """Yield the text content of the items of the top-level lists of an HTML fragment.
+
+    The service documentation is well-formed and attribute-free, so scanning the list
+    tags is enough and avoids building a full DOM for each operation.
+    """
+    list_depth = 0
+    item_start = None
+    for tag in list_tag_query.finditer(documentation):
+        is_closing, tag_name = tag.groups()
+        if tag_name == 'ul':
+            list_depth += -1 if is_closing else 1
+        elif list_depth == 1:
+            if not is_closing:
+                item_start = tag.end()
+            elif item_start is not None:
+                item = documentation[item_start : tag.start()]
+                yield html.unescape(html_tag_query.sub('', item))
+                item_start = None
+
+
 def extract_pagination_config(
     parameters: dict[str, Any],
     max_results: int | None = None,
@@ -188,12 +286,21 @@ def extract_pagination_config(
     return ConfigResult(parameters, pagination_config)
 
 
-endpoint_resolver = session._internal_components.get_component('endpoint_resolver')
-partitions = endpoint_resolver._endpoint_data['partitions']
+@cache
+def _get_endpoint_partitions() -> tuple[EndpointResolver, list[dict[str, Any]]]:
+    endpoint_resolver = get_session()._internal_components.get_component('endpoint_resolver')
+    # Most lookups resolve in the commercial partition, so try it before the others
+    partitions = sorted(
+        endpoint_resolver._endpoint_data['partitions'],
+        key=lambda partition: partition['partition'] != 'aws',
+    )
+    return endpoint_resolver, partitions
 
 
+@lru_cache(maxsize=8192)
 def check_service_has_default_region(service: str, region: str):
     """Check if the service has a default region configured."""
+    endpoint_resolver, partitions = _get_endpoint_partitions()
     for partition in partitions:
         endpoint_config = endpoint_resolver._endpoint_for_partition(
             partition, service, region, use_dualstack_endpoint=False, use_fips_endpoint=False
@@ -201,8 +308,8 @@ def check_service_has_default_region(service: str, region: str):
         if not endpoint_config:
             continue
 
+        # A region belongs to a single partition, so the first match is conclusive
         credentials_scope = endpoint_config.get('credentialScope')
-        if credentials_scope and credentials_scope['region'] != region:
-            return True
+        return bool(credentials_scope and credentials_scope['region'] != region)
 
     return False
@@ -16,11 +16,22 @@ import dataclasses
 from .command_metadata import CommandMetadata
 from botocore import xform_name
 from botocore.model import OperationModel
+from functools import lru_cache
 from jmespath.parser import ParsedResult
 from typing import Any
 
 
-@dataclasses.dataclass(frozen=True)
+@lru_cache(maxsize=4096)
+def _to_python_name(operation_sdk_name: str) -> str:
+    return xform_name(operation_sdk_name)
+
+
+@lru_cache(maxsize=4096)
+def _to_cli_name(operation_sdk_name: str) -> str:
+    return _to_python_name(operation_sdk_name).replace('_', '-')
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class OutputFile:
     """Represents an output file configuration for AWS CLI commands."""
 
@@ -35,7 +46,7 @@ class OutputFile:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class IRCommand:
     """Intermediate representation of an AWS CLI command."""
 
@@ -50,12 +61,12 @@ class IRCommand:
     @property
     def operation_python_name(self):
         """Return the Pythonic operation name for the command."""
-        return xform_name(self.command_metadata.operation_sdk_name)
+        return _to_python_name(self.command_metadata.operation_sdk_name)
 
     @property
     def operation_cli_name(self):
         """Return the Pythonic operation name for the command."""
-        return xform_name(self.command_metadata.operation_sdk_name).replace('_', '-')
+        return _to_cli_name(self.command_metadata.operation_sdk_name)
 
     @property
     def operation_name(self):
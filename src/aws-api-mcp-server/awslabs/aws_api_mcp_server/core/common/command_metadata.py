@@ -15,7 +15,7 @@
 import dataclasses
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class CommandMetadata:
     """Metadata for an AWS CLI command, including service and operation names."""
 
@@ -53,7 +53,10 @@ def get_server_directory():
 
 def get_env_bool(env_key: str, default: bool) -> bool:
     """Get a boolean value from an environment variable, with a default."""
-    return os.getenv(env_key, str(default)).casefold() in TRUTHY_VALUES
+    value = os.environ.get(env_key)
+    if value is None:
+        return default
+    return value.lower() in TRUTHY_VALUES
 
 
 def get_transport_from_env() -> Literal['stdio', 'streamable-http']:
@@ -58,9 +58,13 @@ class Boto3Encoder(json.JSONEncoder):
         return super().default(o)
 
 
+# The encoder holds no per-call state, so a single instance is shared by all calls
+_boto3_encoder = Boto3Encoder()
+
+
 def as_json(boto_response: dict[str, Any]) -> str:
     """Convert a boto3 response dictionary to a JSON string."""
-    return json.dumps(boto_response, cls=Boto3Encoder)
+    return _boto3_encoder.encode(boto_response)
 
 
 def expand_user_home_directory(args: list[str]) -> list[str]:
@@ -131,7 +131,7 @@ class Consent(BaseModel):
     answer: bool
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class IRTranslation:
     """Represents the results of validation and translation to intermediate representation."""
 
@@ -181,7 +181,7 @@ class IRTranslation:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class InterpretedProgram:
     """Translation from CLI to intermediate representation."""
 
@@ -214,5 +214,5 @@ class InterpretedProgram:
         return dataclasses.asdict(self)
 
 
-def _normalize_program(str) -> list[str]:
-    return [line.strip() for line in str.splitlines() if line.strip()]
+def _normalize_program(program: str) -> list[str]:
+    return [line for line in map(str.strip, program.splitlines()) if line]
@@ -39,7 +39,7 @@ class KnowledgeBase:
         self.rag: RAG | None = None
 
     def trim_text(self, text: str, max_length: int) -> str:
-        return f'{text[:max_length]}...' if len(text) > max_length else text
+        return text if len(text) <= max_length else text[:max_length] + '...'
 
     def setup(self, **kwargs):
         self.rag = DenseRetriever(**kwargs)
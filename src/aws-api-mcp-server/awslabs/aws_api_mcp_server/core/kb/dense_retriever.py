@@ -21,7 +21,6 @@ from awscli.clidriver import __version__ as awscli_version
 from copy import deepcopy
 from loguru import logger
 from pathlib import Path
-from sentence_transformers import SentenceTransformer
 
 
 DEFAULT_TOP_K = 5
@@ -59,6 +58,8 @@ class DenseRetriever:
     def model(self):
         """Return the sentence transformer model."""
         if self._model is None:
+            from sentence_transformers import SentenceTransformer
+
             logger.info('Loading embedding model {} ...', self.model_name)
             model_dir = Path(os.path.join(EMBEDDING_MODEL_DIR, self.model_name))
             if not model_dir.exists():
@@ -142,7 +143,8 @@ class DenseRetriever:
         logger.info(f'Loading data from versioned cache: {cache_file}')
         data = np.load(cache_file, allow_pickle=False)
         self._documents = json.loads(str(data['documents']))
-        self._embeddings = data['embeddings']
+        # Embeddings are stored as float16 to halve the cache size, FAISS searches in float32
+        self._embeddings = data['embeddings'].astype('float32', copy=False)
 
     def save_to_cache(self):
         """Save documents and embeddings to cache file."""
@@ -158,7 +160,7 @@ class DenseRetriever:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         np.savez_compressed(
             cache_file,
-            embeddings=self.embeddings,
+            embeddings=self.embeddings.astype('float16'),
             documents=np.array(json.dumps(self.documents)),
         )
 
@@ -170,12 +172,14 @@ class DenseRetriever:
             normalize_embeddings=True,
             batch_size=64,
             show_progress_bar=True,
-        ).astype('float32')
+        ).astype('float32', copy=False)
 
     def get_suggestions(self, query: str, **_kwargs) -> dict[str, list[dict]]:
         """Search for similar documents using the query."""
         # Generate embedding for the query
-        query_embedding = self.model.encode([query], normalize_embeddings=True).astype('float32')
+        query_embedding = self.model.encode([query], normalize_embeddings=True).astype(
+            'float32', copy=False
+        )
 
         # Perform the search
         distances, indices = self.index.search(query_embedding, self.top_k)  # type: ignore
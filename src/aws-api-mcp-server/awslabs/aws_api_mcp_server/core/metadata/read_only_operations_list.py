@@ -11,17 +11,137 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import importlib.resources
 import json
+import os
 import requests
+import stat
+import sys
+import tempfile
+import time
 from collections import defaultdict
 from loguru import logger
-from typing import List
+from pathlib import Path
+from typing import Any, List
 
 
 SERVICE_REFERENCE_URL = 'https://servicereference.us-east-1.amazonaws.com/'
 METADATA_FILE = 'data/api_metadata.json'
 DEFAULT_REQUEST_TIMEOUT = 5
+# The cached documents decide which operations are read-only, so they must live in a directory
+# only the current user can write to rather than under the shared temporary directory.
+SERVICE_REFERENCE_CACHE_DIR = Path.home() / '.aws' / 'aws-api-mcp' / 'service_reference'
+SERVICE_REFERENCE_CACHE_TTL = 24 * 60 * 60
+
+# All service reference documents live on the same host, so keep the connection alive between them
+SERVICE_REFERENCE_SESSION = requests.Session()
+
+
+def _get_private_cache_dir() -> Path | None:
+    """Return the cache directory, or None if other users could tamper with its contents."""
+    try:
+        SERVICE_REFERENCE_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        cache_dir_stat = SERVICE_REFERENCE_CACHE_DIR.stat()
+    except OSError as e:
+        logger.warning(f'Service reference cache directory is not available: {e}')
+        return None
+    if os.name == 'posix' and (
+        cache_dir_stat.st_uid != os.getuid()
+        or cache_dir_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    ):
+        logger.warning(
+            f'Not using the service reference cache: {SERVICE_REFERENCE_CACHE_DIR} is not '
+            'private to the current user'
+        )
+        return None
+    return SERVICE_REFERENCE_CACHE_DIR
+
+
+def _read_cached_document(cache_path: Path) -> tuple[dict[str, Any], float] | None:
+    try:
+        with cache_path.open() as cache_file:
+            cached = json.load(cache_file)
+            modified_at = os.fstat(cache_file.fileno()).st_mtime
+    except (OSError, ValueError):
+        return None
+    # Entries that parse but do not have the expected shape are treated as a cache miss
+    if not isinstance(cached, dict) or 'document' not in cached:
+        return None
+    return cached, time.time() - modified_at
+
+
+def _write_cached_document(cache_path: Path, cached: dict[str, Any]):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(cached, tmp_file)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f'Could not cache the service reference document: {e}')
+
+
+def _load_with_disk_cache(url: str) -> Any:
+    """Get a service reference document, reusing the copy cached on disk when possible.
+
+    A cached document younger than SERVICE_REFERENCE_CACHE_TTL is returned without a request.
+    An older one is revalidated with its ETag/Last-Modified validators and kept on HTTP 304,
+    or when the revalidation request fails.
+    The cache is skipped when its directory could be written by other users.
+    """
+    cache_dir = _get_private_cache_dir()
+    if cache_dir is None:
+        return SERVICE_REFERENCE_SESSION.get(url, timeout=DEFAULT_REQUEST_TIMEOUT).json()
+
+    cache_path = cache_dir / f'{hashlib.sha256(url.encode()).hexdigest()}.json'
+    cached_entry = _read_cached_document(cache_path)
+    if cached_entry is None:
+        response = SERVICE_REFERENCE_SESSION.get(url, timeout=DEFAULT_REQUEST_TIMEOUT)
+    else:
+        cached, age = cached_entry
+        # A modification time in the future is not trusted to keep the copy fresh
+        if 0 <= age < SERVICE_REFERENCE_CACHE_TTL:
+            return cached['document']
+        headers = {}
+        if isinstance(cached.get('etag'), str):
+            headers['If-None-Match'] = cached['etag']
+        if isinstance(cached.get('last_modified'), str):
+            headers['If-Modified-Since'] = cached['last_modified']
+        try:
+            response = SERVICE_REFERENCE_SESSION.get(
+                url, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT
+            )
+        except requests.RequestException as e:
+            logger.warning(f'Could not revalidate {url}, using the cached copy: {e}')
+            return cached['document']
+        if response.status_code == 304:
+            try:
+                cache_path.touch()
+            except OSError:
+                pass
+            return cached['document']
+        if not response.ok:
+            logger.warning(
+                f'Could not revalidate {url} (HTTP {response.status_code}), using the cached copy'
+            )
+            return cached['document']
+
+    document = response.json()
+    if response.ok:
+        _write_cached_document(
+            cache_path,
+            {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'document': document,
+            },
+        )
+    return document
 
 
 class ServiceReferenceUrlsByService(dict):
@@ -31,7 +151,7 @@ class ServiceReferenceUrlsByService(dict):
         """Initialize the urls by service map."""
         super().__init__()
         try:
-            response = requests.get(SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT).json()
+            response = _load_with_disk_cache(SERVICE_REFERENCE_URL)
         except Exception as e:
             logger.error(f'Error retrieving the service reference document: {e}')
             raise RuntimeError(f'Error retrieving the service reference document: {e}')
@@ -46,23 +166,20 @@ class ReadOnlyOperations(dict):
         """Initialize the read only operations list."""
         super().__init__()
         self._service_reference_urls_by_service = service_reference_urls_by_service
-        self._known_readonly_operations = self._get_known_readonly_operations_from_metadata()
-        for service, operations in self._get_custom_readonly_operations().items():
-            if service in self._known_readonly_operations:
-                self._known_readonly_operations[service] = [
-                    *self._known_readonly_operations[service],
-                    *operations,
-                ]
-            else:
-                self._known_readonly_operations[service] = operations
-
-    def has(self, service, operation) -> bool:
+        self._known_readonly_operations = frozenset(
+            (service, operation)
+            for operations_by_service in (
+                self._get_known_readonly_operations_from_metadata(),
+                self._get_custom_readonly_operations(),
+            )
+            for service, operations in operations_by_service.items()
+            for operation in operations
+        )
+
+    def has(self, service: str, operation: str) -> bool:
         """Check if the operation is in the read only operations list."""
         logger.info(f'checking in read only list : {service} - {operation}')
-        if (
-            service in self._known_readonly_operations
-            and operation in self._known_readonly_operations[service]
-        ):
+        if (service, operation) in self._known_readonly_operations:
             return True
         if service not in self:
             if service not in self._service_reference_urls_by_service:
@@ -72,16 +189,15 @@ class ReadOnlyOperations(dict):
 
     def _cache_ready_only_operations_for_service(self, service: str):
         try:
-            response = requests.get(
-                self._service_reference_urls_by_service[service], timeout=DEFAULT_REQUEST_TIMEOUT
-            ).json()
+            response = _load_with_disk_cache(self._service_reference_urls_by_service[service])
         except Exception as e:
             logger.error(f'Error retrieving the service reference document: {e}')
             raise RuntimeError(f'Error retrieving the service reference document: {e}')
-        self[service] = []
-        for action in response['Actions']:
-            if not action['Annotations']['Properties']['IsWrite']:
-                self[service].append(action['Name'])
+        self[service] = frozenset(
+            sys.intern(action['Name'])
+            for action in response['Actions']
+            if not action['Annotations']['Properties']['IsWrite']
+        )
 
     def _get_known_readonly_operations_from_metadata(self) -> dict[str, List[str]]:
         known_readonly_operations = defaultdict(list)
@@ -95,7 +211,7 @@ class ReadOnlyOperations(dict):
             for operation, operation_metadata in operations.items():
                 operation_type = operation_metadata.get('type')
                 if operation_type == 'ReadOnly':
-                    known_readonly_operations[service].append(operation)
+                    known_readonly_operations[sys.intern(service)].append(sys.intern(operation))
         return known_readonly_operations
 
     @staticmethod
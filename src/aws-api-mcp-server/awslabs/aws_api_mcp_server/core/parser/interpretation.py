@@ -28,12 +28,14 @@ from ..common.config import (
 from ..common.file_system_controls import validate_file_path
 from ..common.helpers import operation_timer
 from botocore.config import Config
+from functools import lru_cache
 from jmespath.parser import ParsedResult
 from typing import Any
 
 
 TIMEOUT_AFTER_SECONDS = 10
 CHUNK_SIZE = 4 * 1024 * 1024
+CLIENT_CACHE_SIZE = 32
 
 # Get package version for user agent
 try:
@@ -60,26 +62,15 @@ def interpret(
     parameters = config_result.parameters
     pagination_config = config_result.pagination_config
 
-    config = Config(
-        region_name=region,
-        connect_timeout=TIMEOUT_AFTER_SECONDS,
-        read_timeout=TIMEOUT_AFTER_SECONDS,
-        retries={'max_attempts': 1},
-        user_agent_extra=_get_user_agent_extra(),
-    )
-
     with operation_timer(ir.service_name, ir.operation_python_name, region):
-        client = boto3.client(
-            ir.service_name,
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            aws_session_token=session_token,
-            config=config,
+        cached_client = _get_client(
+            ir.service_name, access_key_id, secret_access_key, session_token, region
         )
+        client = cached_client.client
 
         if client.can_paginate(ir.operation_python_name):
             response = build_result(
-                paginator=client.get_paginator(ir.operation_python_name),
+                paginator=cached_client.get_paginator(ir.operation_python_name),
                 service_name=ir.service_name,
                 operation_name=ir.operation_name,
                 operation_parameters=ir.parameters,
@@ -99,6 +90,53 @@ def interpret(
         return response
 
 
+class _CachedClient:
+    """A boto3 client together with the paginators built from it."""
+
+    def __init__(self, client):
+        """Initialize _CachedClient with the client to wrap."""
+        self.client = client
+        self.paginators: dict[str, Any] = {}
+
+    def get_paginator(self, operation_python_name: str):
+        """Return the paginator of the given operation, building it on first use."""
+        # Paginators keep no per-call state, while building one creates a new class each time
+        paginator = self.paginators.get(operation_python_name)
+        if paginator is None:
+            paginator = self.paginators.setdefault(
+                operation_python_name, self.client.get_paginator(operation_python_name)
+            )
+        return paginator
+
+
+@lru_cache(maxsize=CLIENT_CACHE_SIZE)
+def _get_client(
+    service_name: str,
+    access_key_id: str,
+    secret_access_key: str,
+    session_token: str | None,
+    region: str,
+) -> _CachedClient:
+    # Clients are thread safe and expensive to build, so reuse them for the same credentials.
+    # Paginators are kept with their client so that evicting the client releases them too.
+    config = Config(
+        region_name=region,
+        connect_timeout=TIMEOUT_AFTER_SECONDS,
+        read_timeout=TIMEOUT_AFTER_SECONDS,
+        retries={'max_attempts': 1},
+        user_agent_extra=_get_user_agent_extra(),
+    )
+    return _CachedClient(
+        boto3.client(
+            service_name,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+            aws_session_token=session_token,
+            config=config,
+        )
+    )
+
+
 def _get_user_agent_extra() -> str:
     user_agent_extra = f'awslabs/mcp/AWS-API-MCP-server/{PACKAGE_VERSION}'
     if not OPT_IN_TELEMETRY:
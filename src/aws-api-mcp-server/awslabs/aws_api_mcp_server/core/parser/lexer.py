@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
 import shlex
 from ..common.errors import CliParsingError, ProhibitedOperatorsError
 
@@ -35,15 +36,49 @@ excluded = frozenset(
 )
 
 
+# POSIX shell words as shlex.split sees them: unquoted runs, backslash escapes and quoted strings
+_WORD = re.compile(
+    r'[ \t\r\n]*((?:[^ \t\r\n\'"\\]+|\\.|\'[^\']*\'|"(?:[^"\\]|\\.)*")+)', re.DOTALL
+)
+_WORD_SEGMENT = re.compile(r'\\(.)|\'([^\']*)\'|"((?:[^"\\]|\\.)*)"', re.DOTALL)
+_DOUBLE_QUOTED_ESCAPE = re.compile(r'\\(["\\])')
+
+
+def _unquote_segment(match: re.Match) -> str:
+    escaped, single_quoted, double_quoted = match.groups()
+    if escaped is not None:
+        return escaped
+    if single_quoted is not None:
+        return single_quoted
+    return _DOUBLE_QUOTED_ESCAPE.sub(r'\1', double_quoted)
+
+
+def _split(cli_command: str) -> list[str]:
+    """Split the command like shlex.split, without its per-character Python loop."""
+    tokens = []
+    position = 0
+    for match in _WORD.finditer(cli_command):
+        if match.start() != position:
+            break
+        word = match.group(1)
+        if '\\' in word or "'" in word or '"' in word:
+            word = _WORD_SEGMENT.sub(_unquote_segment, word)
+        tokens.append(word)
+        position = match.end()
+    if cli_command[position:].strip(' \t\r\n'):
+        # Unbalanced quotes or a trailing escape: let shlex produce its usual error
+        return shlex.split(cli_command)
+    return tokens
+
+
 def split_cli_command(cli_command: str) -> list[str]:
     """Split the given CLI command into multiple tokens."""
     try:
-        tokens = shlex.split(cli_command)
+        tokens = _split(cli_command)
     except ValueError as e:
         raise CliParsingError(e) from e
-    prohibited_tokens = [token for token in tokens if token in excluded]
-    if prohibited_tokens:
-        raise ProhibitedOperatorsError(prohibited_tokens)
+    if not excluded.isdisjoint(tokens):
+        raise ProhibitedOperatorsError([token for token in tokens if token in excluded])
     if not tokens:
         raise CliParsingError('The provided CLI command is empty')
     command = tokens[0]
@@ -17,11 +17,12 @@ import botocore.serialize
 import jmespath
 import os
 import re
+import threading
 from ..aws.regions import GLOBAL_SERVICE_REGIONS
 from ..aws.services import (
-    driver,
+    get_driver,
     get_operation_filters,
-    session,
+    get_session,
 )
 from ..common.command import IRCommand, OutputFile
 from ..common.command_metadata import CommandMetadata
@@ -41,7 +42,6 @@ from ..common.errors import (
     MalformedFilterError,
     MissingOperationError,
     MissingRequiredParametersError,
-    MisspelledParametersError,
     OperationNotAllowedError,
     ParameterSchemaValidationError,
     ParameterValidationErrorRecord,
@@ -66,14 +66,16 @@ from awscli.clidriver import ServiceCommand
 from botocore.exceptions import ParamValidationError, UndefinedModelAttributeError
 from botocore.model import OperationModel, ServiceModel
 from collections.abc import Generator
-from difflib import SequenceMatcher
+from functools import cache, cached_property, lru_cache
 from jmespath.exceptions import ParseError
 from pathlib import Path
 from typing import Any, NamedTuple, cast
 
 
+# The optional '(/.*)?' tail that used to follow the resource is covered by '.*$' and only
+# added backtracking on long values.
 ARN_PATTERN = re.compile(
-    r'^(arn:(?:aws|aws-cn|aws-iso|aws-iso-b|aws-iso-e|aws-iso-f|aws-us-gov):[\w\d-]+:([\w\d-]*):\d{0,12}:[\w\d-]*\/?[\w\d-]*)(\/.*)?.*$'
+    r'^(arn:(?:aws|aws-cn|aws-iso|aws-iso-b|aws-iso-e|aws-iso-f|aws-us-gov):[\w-]+:([\w-]*):\d{0,12}:[\w-]*\/?[\w-]*).*$'
 )
 
 # These are subcommands for `aws` which are not actual services.
@@ -130,6 +132,8 @@ _excluded_optional_params = frozenset(
     }
 )
 
+PARSER_CACHE_SIZE = 512
+
 NARGS_ONE_ARGUMENT = None
 NARGS_OPTIONAL = '?'
 NARGS_ONE_OR_MORE = '+'
@@ -149,11 +153,15 @@ ALLOWED_FILTER_KEYS_SUBSETS = {
 }
 
 
+# The validator keeps no state between calls, every validate() reports into fresh errors
+_param_validator = BotoCoreParamValidator()
+
+
 class ParsedOperationArgs(NamedTuple):
     """Named tuple to store parsed operation arguments."""
 
     operation_args: Namespace
-    supported_args: list[str]
+    supported_args: tuple[str, ...]
     given_args: list[str]
     missing_parameters: list[str]
     unknown_parameters: list[str]
@@ -172,9 +180,7 @@ class ArgTableParser(ArgTableArgParser):
         self.command_metadata = command_metadata
         operation_args, unknown_args = super().parse_known_args(args)
 
-        supported_args = [
-            action.option_strings[0] for action in self._actions if action.option_strings
-        ]
+        supported_args = self._supported_args
 
         missing_parameters = list(self._identify_missing_parameters(operation_args))
 
@@ -187,59 +193,72 @@ class ArgTableParser(ArgTableArgParser):
                 param
                 for param in unknown_args
                 if param.startswith('-')
-                and param not in supported_args
+                and param not in self._supported_args_set
                 and not any(arg.startswith(param) for arg in supported_args if self.allow_abbrev)
             ],
             unknown_args=[param for param in unknown_args if not param.startswith('-')],
         )
 
-    def _check_if_misspelled(self, service, operation, supported_args, unknown_args):
-        for unknown_arg in unknown_args:
-            if unknown_arg.startswith('--'):
-                for supported_arg in supported_args:
-                    similarity = SequenceMatcher(None, supported_arg, unknown_arg).ratio()
-                    if similarity >= 0.8:
-                        raise MisspelledParametersError(
-                            service=service,
-                            operation=operation,
-                            unknown_parameter=unknown_arg,
-                            existing_parameter=supported_arg,
-                        )
-
     def error(self, message):  # type: ignore[override]
         """Handle errors during argument parsing."""
         # Skip throwing errors to collate all fields that are missing/not recognized
         pass
 
-    def _identify_missing_parameters(self, operation_args: Namespace) -> Generator[str]:
-        # Check for required named arguments (those with option_strings)
-        required_named_args = {
+    # The actions are fixed once the parser is built, so everything derived from them is
+    # computed on first use and kept for the following parses.
+    @cached_property
+    def _supported_args(self) -> tuple[str, ...]:
+        return tuple(action.option_strings[0] for action in self._actions if action.option_strings)
+
+    @cached_property
+    def _supported_args_set(self) -> frozenset[str]:
+        return frozenset(self._supported_args)
+
+    @cached_property
+    def _required_named_args(self) -> frozenset[str]:
+        # Required named arguments are those with option_strings
+        return frozenset(
             action.option_strings[0]
             for action in self._actions
             if action.option_strings and action.required
-        }
+        )
 
-        # Check for required positional arguments (those without option_strings but with nargs)
-        required_positional_args = {
+    @cached_property
+    def _required_positional_args(self) -> frozenset[str]:
+        # Required positional arguments are those without option_strings but with nargs
+        return frozenset(
             action.dest
             for action in self._actions
             if not action.option_strings
             and action.nargs
             and action.nargs != '?'
             and action.nargs != '*'
-        }
-
-        for name, value in vars(operation_args).items():
-            if value is None:
-                # Check if it's a required named argument
-                cli_param = f'--{name.replace("_", "-")}'
-                if cli_param in required_named_args:
-                    yield cli_param
-                # Check if it's a required positional argument
-                elif name in required_positional_args:
-                    yield name
+        )
+
+    @cached_property
+    def _required_parameters(self) -> tuple[tuple[str, str], ...]:
+        # Pairs of namespace attribute and the name reported when that attribute is missing
+        required_parameters = {}
+        for action in self._actions:
+            name = action.dest
+            # Check if it's a required named argument
+            cli_param = f'--{name.replace("_", "-")}'
+            if cli_param in self._required_named_args:
+                required_parameters.setdefault(name, cli_param)
+            # Check if it's a required positional argument
+            elif name in self._required_positional_args:
+                required_parameters.setdefault(name, name)
+        return tuple(required_parameters.items())
+
+    def _identify_missing_parameters(self, operation_args: Namespace) -> Generator[str]:
+        for name, reported_name in self._required_parameters:
+            if getattr(operation_args, name, argparse.SUPPRESS) is None:
+                yield reported_name
 
     def _get_value(self, action, arg_string):
+        # Untyped and str actions convert to the string itself, the common case for CLI options
+        if action.type is None or action.type is str:
+            return arg_string
         try:
             return super()._get_value(action, arg_string)
         except argparse.ArgumentError as exc:
@@ -255,6 +274,18 @@ class ArgTableParser(ArgTableArgParser):
             ) from exc
 
 
+# Commands live in the driver's command tables for the whole process and argparse does not
+# change a parser while parsing, so each command's parser only needs to be built once.
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _get_service_parser(service_command: ServiceCommand) -> argparse.ArgumentParser:
+    return service_command._create_parser()
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _get_operation_parser(operation_command) -> ArgTableParser:
+    return ArgTableParser(operation_command.arg_table)
+
+
 def _fetch_error_from_number_of_args(nargs: str) -> str:
     return cast(str, _nargs_errors.get(nargs))
 
@@ -285,10 +316,11 @@ class GlobalArgParser(MainArgParser):
     @staticmethod
     def get_parser():
         """Return a new instance of GlobalArgParser."""
+        driver = get_driver()
         return GlobalArgParser(
-            command_table,
-            session.user_agent(),
-            cli_data.get('description', None),
+            driver._get_command_table(),
+            get_session().user_agent(),
+            driver._get_cli_data().get('description', None),
             driver._get_argument_table(),
             prog='aws',
         )
@@ -300,7 +332,7 @@ class GlobalArgParser(MainArgParser):
 
 def is_custom_operation(service, operation):
     """Returns true if the service operation is cli customization."""
-    service_command = command_table.get(service, None)
+    service_command = get_command_table().get(service, None)
     if not service_command:
         raise InvalidServiceError(service)
 
@@ -335,10 +367,32 @@ def is_denied_custom_operation(service, operation):
     )
 
 
-command_table = driver._get_command_table()
-cli_data = driver._get_cli_data()
-parser = GlobalArgParser.get_parser()
-driver._add_aliases(command_table, parser)
+_global_parser: GlobalArgParser | None = None
+_global_parser_lock = threading.Lock()
+
+
+def get_global_parser() -> GlobalArgParser:
+    """Return the global AWS CLI argument parser, building it on first use."""
+    global _global_parser
+    if _global_parser is not None:
+        return _global_parser
+
+    # Locked so that the aliases are added to the command table exactly once
+    with _global_parser_lock:
+        if _global_parser is None:
+            driver = get_driver()
+            global_parser = GlobalArgParser.get_parser()
+            driver._add_aliases(driver._get_command_table(), global_parser)
+            # Published only once complete, since other threads read it without the lock
+            _global_parser = global_parser
+        return _global_parser
+
+
+def get_command_table() -> dict[str, Any]:
+    """Return the AWS CLI command table, including the aliases of the global parser."""
+    # Aliases are only added to the command table once the global parser is built
+    get_global_parser()
+    return get_driver()._get_command_table()
 
 
 def parse(cli_command: str) -> IRCommand:
@@ -346,8 +400,8 @@ def parse(cli_command: str) -> IRCommand:
     tokens = split_cli_command(cli_command)
     # Strip `aws` and expand paths beginning with ~
     tokens = expand_user_home_directory(tokens[1:])
-    global_args, remaining = parser.parse_known_args(tokens)
-    service_command = command_table[global_args.command]
+    global_args, remaining = get_global_parser().parse_known_args(tokens)
+    service_command = get_command_table()[global_args.command]
 
     # Not all commands have parsers as some of them are "aliases" to existing services
     if isinstance(service_command, ServiceCommand):
@@ -386,9 +440,9 @@ def _handle_service_command(
     _validate_global_args(service, global_args)
     region = getattr(global_args, 'region', None)
 
-    service_parser = service_command._create_parser()
+    service_parser = _get_service_parser(service_command)
     service_args, service_remaining = service_parser.parse_known_args(remaining)
-    operation_parser = ArgTableParser(operation_command.arg_table)
+    operation_parser = _get_operation_parser(operation_command)
     parsed_args = operation_parser.parse_operation_args(command_metadata, service_remaining)
     _handle_invalid_parameters(command_metadata, service, operation, parsed_args)
 
@@ -455,8 +509,7 @@ def _handle_awscli_customization(
 
     operation = remaining[0]
 
-    command_table = driver._get_command_table()
-    service_command = command_table.get(service)
+    service_command = get_command_table().get(service)
 
     if service_command is None:
         raise InvalidServiceError(service)
@@ -507,7 +560,7 @@ def _parse_customization_parameters(
     if not hasattr(operation_command, 'arg_table'):
         raise InvalidServiceOperationError(service, operation)
 
-    operation_parser = ArgTableParser(operation_command.arg_table)
+    operation_parser = _get_operation_parser(operation_command)
     parsed_args = operation_parser.parse_operation_args(command_metadata, operation_args)
 
     _handle_invalid_parameters(command_metadata, service, operation, parsed_args)
@@ -637,16 +690,6 @@ def _validate_parameters(
     arg_table: dict[str, BaseCLIArgument],
     operation_model: OperationModel,
 ) -> None:
-    validator = BotoCoreParamValidator()
-
-    serialized_to_cli = {
-        arg._serialized_name: arg.cli_name
-        for arg in arg_table.values()
-        if isinstance(arg, CLIArgument)
-        and hasattr(arg, '_serialized_name')
-        and hasattr(arg, 'cli_name')
-    }
-
     errors = []
 
     input_shape = operation_model.input_shape
@@ -655,14 +698,40 @@ def _validate_parameters(
     for key, value in parameters.items():
         boto3_shape = boto3_members.get(key)
         if boto3_shape is not None:
-            report = validator.validate(value, boto3_shape)
+            report = _param_validator.validate(value, boto3_shape)
             if report.has_errors():
-                cli_name = serialized_to_cli.get(key, key)
-                errors.append(ParameterValidationErrorRecord(cli_name, report.generate_report()))
+                errors.append(
+                    ParameterValidationErrorRecord(
+                        _serialized_name_to_cli_name(arg_table, key), report.generate_report()
+                    )
+                )
     if errors:
         raise ParameterSchemaValidationError(errors)
 
 
+def _serialized_name_to_cli_name(arg_table: dict[str, BaseCLIArgument], key: str) -> str:
+    # Only needed to report errors, so the arg table is searched instead of indexed up front
+    for arg in arg_table.values():
+        if (
+            isinstance(arg, CLIArgument)
+            and hasattr(arg, '_serialized_name')
+            and hasattr(arg, 'cli_name')
+            and arg._serialized_name == key
+        ):
+            return arg.cli_name
+    return key
+
+
+@cache
+def _get_filter_name_key(filter_keys: frozenset[str]) -> str | None:
+    # Few distinct filter shapes exist, so resolve each one once
+    filter_name_key = None
+    for allowed_keys_subset, name_key in ALLOWED_FILTER_KEYS_SUBSETS.items():
+        if allowed_keys_subset.issubset(filter_keys):
+            filter_name_key = name_key
+    return filter_name_key
+
+
 def _validate_filters(
     service: str, operation: str, operation_model: OperationModel, parameters: dict[str, Any]
 ):
@@ -672,11 +741,7 @@ def _validate_filters(
     filters = parameters['Filters']
     known_filters = get_operation_filters(operation_model)
 
-    filter_name_key = None
-    for allowed_keys_subset, name_key in ALLOWED_FILTER_KEYS_SUBSETS.items():
-        if allowed_keys_subset.issubset(known_filters.filter_keys):
-            filter_name_key = name_key
-
+    filter_name_key = _get_filter_name_key(known_filters.filter_keys)
     if filter_name_key is None:
         raise UnsupportedFilterError(service, operation, known_filters.filter_keys)
 
@@ -731,13 +796,13 @@ def _validate_request_serialization(
     operation_model: OperationModel,
     parameters: dict[str, Any],
 ):
-    validated_parameters = parameters.copy()
-    validated_parameters.pop('PaginationConfig', None)
+    validated_parameters = parameters
+    if 'PaginationConfig' in parameters:
+        validated_parameters = parameters.copy()
+        del validated_parameters['PaginationConfig']
 
     # Parameter validation has been done, just serialize
-    serializer = botocore.serialize.create_serializer(
-        service_model.metadata['protocol'], include_validation=False
-    )
+    serializer = _get_serializer(service_model.metadata['protocol'])
     try:
         serializer.serialize_to_request(validated_parameters, operation_model)
     except ParamValidationError as err:
@@ -746,6 +811,12 @@ def _validate_request_serialization(
         ) from err
 
 
+@lru_cache(maxsize=16)
+def _get_serializer(protocol: str) -> botocore.serialize.Serializer:
+    # Serializers keep no per-request state, botocore itself uses one per client
+    return botocore.serialize.create_serializer(protocol, include_validation=False)
+
+
 def _validate_file_paths(
     command_metadata: CommandMetadata,
     parsed_args: ParsedOperationArgs | None,
@@ -795,10 +866,11 @@ def _validate_file_path(file_path: str, service: str, operation: str):
 
 def _fetch_region_from_arn(parameters: dict[str, Any]) -> str | None:
     for param_value in parameters.values():
-        if isinstance(param_value, str):
+        # Cheap check first: the pattern is anchored on the 'arn:' prefix anyway
+        if isinstance(param_value, str) and param_value.startswith('arn:'):
             m = ARN_PATTERN.match(param_value)
-            if m and m.groups()[1]:
-                return m.groups()[1]
+            if m and m.group(2):
+                return m.group(2)
     return None
 
 
@@ -28,6 +28,19 @@ from pathlib import Path
 from typing import Optional
 
 
+GITHUB_API_HEADERS = (
+    '-H',
+    'Accept: application/vnd.github+json',
+    '-H',
+    'X-GitHub-Api-Version: 2022-11-28',
+)
+
+
+def gh_api_command(*args: str) -> list[str]:
+    """Build a GitHub CLI API command with the GitHub REST API headers."""
+    return ['gh', 'api', *GITHUB_API_HEADERS, *args]
+
+
 def run_command(command: list[str]) -> subprocess.CompletedProcess:
     """Run a command and return the result, printing all output on error."""
     logger.info('Running: {}', ' '.join(command))
@@ -47,16 +60,10 @@ def run_command(command: list[str]) -> subprocess.CompletedProcess:
 def get_latest_artifact() -> Optional[dict]:
     """Get the latest dist-aws-api-mcp-server artifact from GitHub."""
     try:
-        cmd = [
-            'gh',
-            'api',
+        cmd = gh_api_command(
             '--paginate',
-            '-H',
-            'Accept: application/vnd.github+json',
-            '-H',
-            'X-GitHub-Api-Version: 2022-11-28',
             '/repos/awslabs/mcp/actions/artifacts?name=dist-aws-api-mcp-server&per_page=100',
-        ]
+        )
 
         result = run_command(cmd)
 
@@ -105,22 +112,10 @@ def is_within_directory(directory: Path, target: Path) -> bool:
         return False
 
 
-def safe_extract_zip(zip_ref: zipfile.ZipFile, path: Path):
-    """Safely extract zip file to the given path, preventing path traversal."""
-    for member in zip_ref.namelist():
-        member_path = path / member
-        if not is_within_directory(path, member_path):
-            raise Exception(f'Unsafe zip file member: {member}')
-        # Create parent directories if needed
-        member_path.parent.mkdir(parents=True, exist_ok=True)
-        if not member.endswith('/'):  # skip directories
-            with zip_ref.open(member) as source, open(member_path, 'wb') as target:
-                target.write(source.read())
-
-
 def safe_extract_tar(tar_ref: tarfile.TarFile, path: Path):
     """Safely extract tar file to the given path, preventing path traversal."""
-    for member in tar_ref.getmembers():
+    # Iterating the archive works for both seekable files and streams
+    for member in tar_ref:
         member_path = path / member.name
         if not is_within_directory(path, member_path):
             raise Exception(f'Unsafe tar file member: {member.name}')
@@ -136,44 +131,33 @@ def download_artifact(artifact: dict) -> tuple[bool, Optional[Path]]:
         logger.info('Created temporary directory: {}', temp_dir)
 
         # Download the artifact
-        cmd = [
-            'gh',
-            'api',
-            '-H',
-            'Accept: application/vnd.github+json',
-            '-H',
-            'X-GitHub-Api-Version: 2022-11-28',
-            artifact['archive_download_url'],
-        ]
-
-        # Download as binary
-        result = subprocess.run(cmd, capture_output=True, check=True)
+        cmd = gh_api_command(artifact['archive_download_url'])
 
-        # Save to file in temp directory
+        # Stream the binary straight to a file in temp directory
         artifact_zip = temp_dir / 'artifact.zip'
         with open(artifact_zip, 'wb') as f:
-            f.write(result.stdout)
+            subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, check=True)
 
         logger.info('Downloaded artifact.zip')
 
-        # Extract the zip file
         with zipfile.ZipFile(artifact_zip, 'r') as zip_ref:
-            safe_extract_zip(zip_ref, temp_dir)
-
-        logger.info('Extracted artifact.zip')
-
-        # Find the tar.gz file and extract it
-        tar_files = list(temp_dir.glob('*.tar.gz'))
-        if not tar_files:
-            logger.info('No tar.gz file found in artifact')
-            return False, None
+            # Find the top-level tar.gz file in the artifact
+            tar_files = [
+                name for name in zip_ref.namelist() if name.endswith('.tar.gz') and '/' not in name
+            ]
+            if not tar_files:
+                logger.info('No tar.gz file found in artifact')
+                return False, None
 
-        tar_file = tar_files[0]
-        logger.info('Found tar file: {}', tar_file)
+            tar_file = tar_files[0]
+            logger.info('Found tar file: {}', tar_file)
 
-        # Extract the tar.gz file
-        with tarfile.open(tar_file, 'r:gz') as tar_ref:
-            safe_extract_tar(tar_ref, temp_dir)
+            # Extract the tar.gz file straight from the zip, without unpacking it to disk first
+            with (
+                zip_ref.open(tar_file) as tar_stream,
+                tarfile.open(fileobj=tar_stream, mode='r|gz') as tar_ref,
+            ):
+                safe_extract_tar(tar_ref, temp_dir)
 
         logger.info('Extracted {}', tar_file)
 
@@ -207,15 +191,13 @@ def check_embeddings_file(extracted_dir: Path) -> Optional[Path]:
 
     # Look for embeddings file with the correct awscli version
     KNOWLEDGE_BASE_SUFFIX = 'knowledge-base-awscli'
-    expected_pattern = f'{KNOWLEDGE_BASE_SUFFIX}-{awscli_version}.npz'
-    matching_files = list(embeddings_dir.glob(expected_pattern))
+    embeddings_file = embeddings_dir / f'{KNOWLEDGE_BASE_SUFFIX}-{awscli_version}.npz'
 
-    if matching_files:
-        embeddings_file = matching_files[0]
+    if embeddings_file.is_file():
         logger.info('Found matching embeddings file: {}', embeddings_file)
         return embeddings_file
 
-    logger.info('No embeddings file found matching pattern: {}', expected_pattern)
+    logger.info('No embeddings file found: {}', embeddings_file.name)
     return None
 
 
@@ -247,16 +229,13 @@ def cleanup(temp_dir: Optional[Path] = None):
 def check_local_embeddings() -> bool:
     """Check if embeddings file already exists locally."""
     embeddings_dir = Path(__file__).resolve().parent.parent / 'core' / 'data' / 'embeddings'
-    if not embeddings_dir.exists():
-        return False
 
     # Look for embeddings file with the correct awscli version
     KNOWLEDGE_BASE_SUFFIX = 'knowledge-base-awscli'
-    expected_pattern = f'{KNOWLEDGE_BASE_SUFFIX}-{awscli_version}.npz'
-    matching_files = list(embeddings_dir.glob(expected_pattern))
+    embeddings_file = embeddings_dir / f'{KNOWLEDGE_BASE_SUFFIX}-{awscli_version}.npz'
 
-    if matching_files:
-        logger.info('Found local embeddings file: {}', matching_files[0])
+    if embeddings_file.is_file():
+        logger.info('Found local embeddings file: {}', embeddings_file)
         return True
 
     return False
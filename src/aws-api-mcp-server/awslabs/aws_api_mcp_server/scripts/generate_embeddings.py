@@ -16,7 +16,7 @@ import argparse
 import re
 import sys
 import time
-from ..core.aws.services import driver
+from ..core.aws.services import get_driver
 from ..core.kb.dense_retriever import (
     DEFAULT_CACHE_DIR,
     DEFAULT_EMBEDDING_MODEL,
@@ -38,15 +38,17 @@ from typing import Any
 
 IGNORED_ARGUMENTS = frozenset({'cli-input-json', 'generate-cli-skeleton'})
 
+description_title_query = re.compile(r'=+\s*Description\s*=+\s')
+
 
 def _clean_text(text: str) -> str:
-    text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-    return text.strip()
+    # Normalize whitespace, splitting on the same characters as \s
+    return ' '.join(text.split())
 
 
 def _clean_description(description: str) -> str:
     """This removes the section title added by the help event handlers."""
-    description = re.sub(r'=+\s*Description\s*=+\s', '', description)
+    description = description_title_query.sub('', description)
     return _clean_text(description)
 
 
@@ -91,7 +93,7 @@ def _generate_operation_document(
 
 def _get_aws_api_documents() -> list[dict[str, Any]]:
     documents = []
-    for service_name, command in driver._get_command_table().items():
+    for service_name, command in get_driver()._get_command_table().items():
         if service_name in DENIED_CUSTOM_SERVICES:
             continue
         try:
@@ -14,6 +14,7 @@
 
 import os
 import sys
+import threading
 from .core.agent_scripts.manager import AGENT_SCRIPTS_MANAGER
 from .core.aws.driver import translate_cli_to_ir
 from .core.aws.service import (
@@ -23,6 +24,7 @@ from .core.aws.service import (
     request_consent,
     validate,
 )
+from .core.aws.services import OPERATION_FILTERS_WARMUP_SERVICES, warmup_operation_filters
 from .core.common.config import (
     DEFAULT_REGION,
     ENABLE_AGENT_SCRIPTS,
@@ -239,11 +241,11 @@ async def call_aws(
         if READ_OPERATIONS_INDEX is not None:
             policy_decision = check_security_policy(ir, READ_OPERATIONS_INDEX, ctx)
 
-            if policy_decision == PolicyDecision.DENY:
+            if policy_decision is PolicyDecision.DENY:
                 error_message = 'Execution of this operation is denied by security policy.'
                 await ctx.error(error_message)
                 return AwsApiMcpServerErrorResponse(detail=error_message)
-            elif policy_decision == PolicyDecision.ELICIT:
+            elif policy_decision is PolicyDecision.ELICIT:
                 await request_consent(cli_command, ctx)
         else:
             if READ_OPERATIONS_ONLY_MODE:
@@ -370,6 +372,11 @@ def main():
         logger.error(error_message)
         raise RuntimeError(error_message)
 
+    # Parse filter documentation in background so the first filtered commands don't pay for it
+    threading.Thread(
+        target=warmup_operation_filters, args=(OPERATION_FILTERS_WARMUP_SERVICES,), daemon=True
+    ).start()
+
     # Always load read operations index for security policy checking
     try:
         READ_OPERATIONS_INDEX = get_read_only_operations()
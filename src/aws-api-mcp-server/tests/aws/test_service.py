@@ -8,6 +8,7 @@ from awslabs.aws_api_mcp_server.core.aws.service import (
     is_operation_read_only,
     validate,
 )
+from awslabs.aws_api_mcp_server.core.aws.services import get_driver
 from awslabs.aws_api_mcp_server.core.common.command import IRCommand
 from awslabs.aws_api_mcp_server.core.common.helpers import as_json
 from awslabs.aws_api_mcp_server.core.common.models import (
@@ -448,9 +449,10 @@ def test_is_operation_read_only_raises_error_for_missing_operation_name():
         is_operation_read_only(ir, read_only_operations)
 
 
-@patch('awslabs.aws_api_mcp_server.core.aws.service.driver')
-def test_execute_awscli_customization_success(mock_driver):
+@patch('awslabs.aws_api_mcp_server.core.aws.service.get_driver')
+def test_execute_awscli_customization_success(mock_get_driver):
     """Test execute_awscli_customization returns AwsCliAliasResponse on successful execution."""
+    mock_driver = mock_get_driver.return_value
     mock_driver.main.return_value = None
 
     with patch('awslabs.aws_api_mcp_server.core.aws.service.StringIO') as mock_stringio:
@@ -472,9 +474,10 @@ def test_execute_awscli_customization_success(mock_driver):
         mock_driver.main.assert_called_once_with(['s3', 'ls'])
 
 
-@patch('awslabs.aws_api_mcp_server.core.aws.service.driver')
-def test_execute_awscli_customization_error(mock_driver):
+@patch('awslabs.aws_api_mcp_server.core.aws.service.get_driver')
+def test_execute_awscli_customization_error(mock_get_driver):
     """Test execute_awscli_customization returns AwsApiMcpServerErrorResponse on exception."""
+    mock_driver = mock_get_driver.return_value
     mock_driver.main.side_effect = Exception('Invalid command')
 
     result = execute_awscli_customization(
@@ -494,7 +497,7 @@ def test_execute_awscli_customization_error(mock_driver):
     mock_driver.main.assert_called_once_with(['invalid', 'command'])
 
 
-@patch('awslabs.aws_api_mcp_server.core.aws.service.driver.main')
+@patch.object(get_driver(), 'main')
 @patch('awslabs.aws_api_mcp_server.core.aws.service.AWS_API_MCP_PROFILE_NAME', None)
 def test_profile_not_added_when_env_var_none(mock_main):
     """Test that profile is not added when AWS_API_MCP_PROFILE_NAME is None."""
@@ -509,7 +512,7 @@ def test_profile_not_added_when_env_var_none(mock_main):
     assert '--profile' not in args
 
 
-@patch('awslabs.aws_api_mcp_server.core.aws.service.driver.main')
+@patch.object(get_driver(), 'main')
 @patch('awslabs.aws_api_mcp_server.core.aws.service.AWS_API_MCP_PROFILE_NAME', 'test-profile')
 def test_profile_added_when_env_var_set(mock_main):
     """Test that profile is added when AWS_API_MCP_PROFILE_NAME is set."""
@@ -526,7 +529,7 @@ def test_profile_added_when_env_var_set(mock_main):
     assert args[profile_index + 1] == 'test-profile'
 
 
-@patch('awslabs.aws_api_mcp_server.core.aws.service.driver.main')
+@patch.object(get_driver(), 'main')
 @patch('awslabs.aws_api_mcp_server.core.aws.service.AWS_API_MCP_PROFILE_NAME', 'test-profile')
 @patch('awslabs.aws_api_mcp_server.core.parser.parser.get_region', return_value='us-east-1')
 def test_profile_not_added_if_present_for_customizations(mock_get_region, mock_main):
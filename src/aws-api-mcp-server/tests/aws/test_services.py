@@ -1,7 +1,18 @@
 import pytest
 from awslabs.aws_api_mcp_server.core.aws.services import (
+    _build_operation_filters,
+    _operation_filters_cache,
+    _top_level_list_items,
+    _unreported_empty_filter_sets,
+    check_service_has_default_region,
     extract_pagination_config,
+    get_driver,
+    get_operation_filters,
+    get_session,
+    warmup_operation_filters,
 )
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 
 MAX_RESULTS = 6
@@ -26,3 +37,82 @@ def test_max_results(max_result_config, max_result_param, expected_max_result):
     max_results = pagination_config.get('MaxItems')
     assert max_results == expected_max_result
     assert updated_parameters.get('PaginationConfig') is None
+
+
+@pytest.mark.parametrize(
+    'service, region, expected',
+    [
+        ('iam', 'aws-global', True),  # global endpoint scoped to us-east-1
+        ('iam', 'aws-cn-global', True),  # global endpoint outside the aws partition
+        ('s3', 'us-west-2', False),  # regional endpoint
+        ('ec2', 'cn-north-1', False),  # regional endpoint outside the aws partition
+    ],
+)
+def test_check_service_has_default_region(service, region, expected):
+    """Test that services with a global credential scope are detected in every partition."""
+    assert check_service_has_default_region(service, region) is expected
+
+
+def test_get_operation_filters_is_cached():
+    """Test that filters are computed once per service operation."""
+    operation = get_session().get_service_model('ec2').operation_model('DescribeInstances')
+
+    with patch(
+        'awslabs.aws_api_mcp_server.core.aws.services._build_operation_filters',
+        wraps=_build_operation_filters,
+    ) as mock_build:
+        _operation_filters_cache.pop(('ec2', 'DescribeInstances'), None)
+        first = get_operation_filters(operation)
+        second = get_operation_filters(operation)
+
+    assert first is second
+    assert 'instance-id' in first.filter_set
+    mock_build.assert_called_once_with(operation)
+
+
+def test_warmup_operation_filters():
+    """Test that warming up a service caches the filters of all its operations."""
+    service_model = get_session().get_service_model('rds')
+    for operation_name in service_model.operation_names:
+        _operation_filters_cache.pop(('rds', operation_name), None)
+
+    with patch('awslabs.aws_api_mcp_server.core.aws.services.logger') as mock_logger:
+        warmup_operation_filters(['rds'], max_workers=2)
+
+    assert ('rds', 'DescribeDBInstances') in _operation_filters_cache
+    assert 'db-instance-id' in _operation_filters_cache[('rds', 'DescribeDBInstances')].filter_set
+    mock_logger.warning.assert_not_called()
+
+
+def test_get_operation_filters_warns_once_about_empty_filter_set():
+    """Test that an empty filter set is reported on the first lookup only."""
+    # ListNotebookMetadata documents a single structure of filters rather than a list
+    operation = get_session().get_service_model('athena').operation_model('ListNotebookMetadata')
+    _operation_filters_cache.pop(('athena', 'ListNotebookMetadata'), None)
+    _unreported_empty_filter_sets.discard(('athena', 'ListNotebookMetadata'))
+
+    with patch('awslabs.aws_api_mcp_server.core.aws.services.logger') as mock_logger:
+        get_operation_filters(operation)
+        get_operation_filters(operation)
+
+    mock_logger.warning.assert_called_once()
+
+
+def test_get_driver_is_shared_across_threads():
+    """Test that concurrent callers all get the same AWS CLI driver."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        drivers = list(executor.map(lambda _: get_driver(), range(8)))
+
+    assert all(driver is drivers[0] for driver in drivers)
+
+
+def test_top_level_list_items():
+    """Test that only the top-level list items are extracted, including nested text."""
+    documentation = (
+        '<p>Filters:</p> <ul> <li> <p> <code>status</code> - One of:</p> '
+        '<ul> <li> <p> <code>available</code> </p> </li> </ul> </li> '
+        '<li> <p> <code>tag:&lt;key&gt;</code> - A tag.</p> </li> </ul>'
+    )
+
+    items = [' '.join(item.split()) for item in _top_level_list_items(documentation)]
+    assert items == ['status - One of: available', 'tag:<key> - A tag.']
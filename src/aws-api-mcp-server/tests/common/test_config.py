@@ -1,5 +1,6 @@
 import pytest
 from awslabs.aws_api_mcp_server.core.common.config import (
+    get_env_bool,
     get_region,
     get_server_directory,
     get_transport_from_env,
@@ -133,3 +134,27 @@ def test_get_transport_from_env_invalid_values(monkeypatch, invalid_transport):
 
     with pytest.raises(ValueError, match=f'Invalid transport: {invalid_transport}'):
         get_transport_from_env()
+
+
+@pytest.mark.parametrize(
+    'env_value,default,expected',
+    [
+        (None, True, True),
+        (None, False, False),
+        ('true', False, True),
+        ('TRUE', False, True),
+        ('yes', False, True),
+        ('1', False, True),
+        ('false', True, False),
+        ('0', True, False),
+        ('', True, False),
+    ],
+)
+def test_get_env_bool(monkeypatch, env_value, default, expected):
+    """Test get_env_bool falls back to the default only when the variable is unset."""
+    if env_value is None:
+        monkeypatch.delenv('TEST_ENV_BOOL', raising=False)
+    else:
+        monkeypatch.setenv('TEST_ENV_BOOL', env_value)
+
+    assert get_env_bool('TEST_ENV_BOOL', default) is expected
@@ -4,6 +4,7 @@ import contextlib
 import datetime
 from .history_handler import history
 from awslabs.aws_api_mcp_server.core.common.models import Credentials
+from awslabs.aws_api_mcp_server.core.parser.interpretation import _get_client
 from copy import deepcopy
 from unittest.mock import MagicMock, patch
 
@@ -262,6 +263,7 @@ def patch_boto3():
     def mock_can_paginate(self, operation_name):
         return False
 
+    _get_client.cache_clear()
     with patch(
         'awslabs.aws_api_mcp_server.core.aws.driver.get_local_credentials',
         return_value=Credentials(**TEST_CREDENTIALS),
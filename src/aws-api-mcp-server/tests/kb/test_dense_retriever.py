@@ -183,6 +183,7 @@ def test_save_to_cache_success():
         assert 'embeddings' in data
         assert 'documents' in data
         assert data['embeddings'].shape == (2, 3)
+        assert data['embeddings'].dtype == np.float16
 
 
 def test_generate_index():
@@ -338,6 +339,7 @@ def test_load_from_cache_with_version_success():
 
         assert rag.documents == mock_documents
         np.testing.assert_array_equal(rag.embeddings, mock_embeddings)
+        assert rag.embeddings.dtype == np.float32
 
 
 def test_get_suggestions_with_mock_model():
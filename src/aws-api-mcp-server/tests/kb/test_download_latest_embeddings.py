@@ -12,10 +12,10 @@ from awslabs.aws_api_mcp_server.scripts.download_latest_embeddings import (
     copy_embeddings_file,
     download_artifact,
     get_latest_artifact,
+    gh_api_command,
     is_within_directory,
     run_command,
     safe_extract_tar,
-    safe_extract_zip,
     try_download_latest_embeddings,
 )
 from pathlib import Path
@@ -65,6 +65,20 @@ def test_run_command_failure():
             run_command(['echo', 'test'])
 
 
+def test_gh_api_command():
+    """Test that GitHub CLI API commands carry the REST API headers."""
+    assert gh_api_command('--paginate', '/repos/awslabs/mcp') == [
+        'gh',
+        'api',
+        '-H',
+        'Accept: application/vnd.github+json',
+        '-H',
+        'X-GitHub-Api-Version: 2022-11-28',
+        '--paginate',
+        '/repos/awslabs/mcp',
+    ]
+
+
 @patch('awslabs.aws_api_mcp_server.scripts.download_latest_embeddings.run_command')
 def test_get_latest_artifact_success(mock_run_command):
     """Test successful artifact retrieval."""
@@ -175,35 +189,6 @@ def test_is_within_directory_exception():
         assert result is False
 
 
-def test_safe_extract_zip_normal_file():
-    """Test safe extraction of normal file."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create a mock zip file
-        mock_zip = MagicMock()
-        mock_zip.namelist.return_value = ['test.txt']
-
-        with patch('builtins.open', mock_open()):
-            safe_extract_zip(mock_zip, temp_path)
-
-            # Should create parent directories
-            assert (temp_path / 'test.txt').parent.exists()
-
-
-def test_safe_extract_zip_path_traversal():
-    """Test that path traversal is prevented."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Create a mock zip file with path traversal
-        mock_zip = MagicMock()
-        mock_zip.namelist.return_value = ['../../../etc/passwd']
-
-        with pytest.raises(Exception, match='Unsafe zip file member'):
-            safe_extract_zip(mock_zip, temp_path)
-
-
 def test_safe_extract_tar_normal_file():
     """Test safe extraction of normal file."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -213,7 +198,7 @@ def test_safe_extract_tar_normal_file():
         mock_tar = MagicMock()
         mock_member = MagicMock()
         mock_member.name = 'test.txt'
-        mock_tar.getmembers.return_value = [mock_member]
+        mock_tar.__iter__.return_value = iter([mock_member])
 
         safe_extract_tar(mock_tar, temp_path)
 
@@ -229,7 +214,7 @@ def test_safe_extract_tar_path_traversal():
         mock_tar = MagicMock()
         mock_member = MagicMock()
         mock_member.name = '../../../etc/passwd'
-        mock_tar.getmembers.return_value = [mock_member]
+        mock_tar.__iter__.return_value = iter([mock_member])
 
         with pytest.raises(Exception, match='Unsafe tar file member'):
             safe_extract_tar(mock_tar, temp_path)
@@ -241,11 +226,6 @@ def test_safe_extract_tar_path_traversal():
 @patch('builtins.open', new_callable=mock_open)
 def test_download_artifact_success(mock_file_open, mock_tar_open, mock_zip_file, mock_run):
     """Test successful artifact download and extraction."""
-    # Mock subprocess.run for download
-    mock_result = MagicMock()
-    mock_result.stdout = b'fake zip content'
-    mock_run.return_value = mock_result
-
     # Mock zip file
     mock_zip = MagicMock()
     mock_zip.namelist.return_value = ['artifact.tar.gz']
@@ -260,20 +240,23 @@ def test_download_artifact_success(mock_file_open, mock_tar_open, mock_zip_file,
         'archive_download_url': 'https://api.github.com/repos/owner/repo/actions/artifacts/123/zip'
     }
 
-    mock_tar_file = MagicMock()
-    mock_tar_file.name = 'artifact.tar.gz'
     mock_extracted_dir = MagicMock()
     mock_extracted_dir.is_dir.return_value = True
     mock_extracted_dir.name = 'awslabs-mcp-server-123'
 
-    with (
-        patch.object(Path, 'glob', return_value=[mock_tar_file]),
-        patch.object(Path, 'iterdir', return_value=[mock_extracted_dir]),
-    ):
+    with patch.object(Path, 'iterdir', return_value=[mock_extracted_dir]):
         success, extracted_path = download_artifact(artifact)
 
     assert success is True
     assert extracted_path is not None
+    # The archive is streamed to the file rather than buffered in memory
+    assert mock_run.call_args.kwargs['stdout'] is mock_file_open.return_value
+    # The tar.gz is read straight from the zip instead of being unpacked to disk first
+    mock_zip.open.assert_called_once_with('artifact.tar.gz')
+    mock_tar_open.assert_called_once_with(
+        fileobj=mock_zip.open.return_value.__enter__.return_value, mode='r|gz'
+    )
+    mock_tar.__iter__.assert_called_once()
 
 
 @patch('awslabs.aws_api_mcp_server.scripts.download_latest_embeddings.subprocess.run')
@@ -408,11 +391,10 @@ def test_check_local_embeddings_found(mock_path):
     mock_core.__truediv__.return_value = mock_data
     mock_data.__truediv__.return_value = mock_embeddings_dir
 
-    # Set up the embeddings dir mock
-    mock_embeddings_dir.exists.return_value = True
-    mock_embeddings_dir.glob.return_value = [
-        Path(f'/fake/path/knowledge-base-awscli-{awscli_version}.npz')
-    ]
+    # Set up the embeddings file mock
+    mock_embeddings_file = MagicMock()
+    mock_embeddings_file.is_file.return_value = True
+    mock_embeddings_dir.__truediv__.return_value = mock_embeddings_file
 
     # Make Path constructor return our mock
     mock_path.return_value = mock_path_instance
@@ -420,6 +402,9 @@ def test_check_local_embeddings_found(mock_path):
     result = check_local_embeddings()
 
     assert result is True
+    mock_embeddings_dir.__truediv__.assert_called_once_with(
+        f'knowledge-base-awscli-{awscli_version}.npz'
+    )
 
 
 def test_check_local_embeddings_not_found():
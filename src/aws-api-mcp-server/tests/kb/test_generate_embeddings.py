@@ -3,7 +3,7 @@ import re
 import sys
 import tempfile
 from awscli.clidriver import __version__ as awscli_version
-from awslabs.aws_api_mcp_server.core.aws.services import driver
+from awslabs.aws_api_mcp_server.core.aws.services import get_driver
 from awslabs.aws_api_mcp_server.core.kb.dense_retriever import (
     DEFAULT_CACHE_DIR,
     KNOWLEDGE_BASE_SUFFIX,
@@ -18,7 +18,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 
-@patch('awslabs.aws_api_mcp_server.scripts.generate_embeddings.driver._get_command_table')
+@patch.object(get_driver(), '_get_command_table')
 @patch('awslabs.aws_api_mcp_server.scripts.generate_embeddings.logger')
 def test_generate_embeddings_handles_exceptions(mock_logger, mock_get_command_table):
     """Test that exceptions during document retrieval are handled gracefully."""
@@ -99,7 +99,7 @@ def test_generate_embeddings_overwrite_existing(
         mock_retriever_instance.save_to_cache.assert_called_once()
 
 
-@patch('awslabs.aws_api_mcp_server.scripts.generate_embeddings.driver._get_command_table')
+@patch.object(get_driver(), '_get_command_table')
 @patch('awslabs.aws_api_mcp_server.scripts.generate_embeddings.logger')
 @patch('awslabs.aws_api_mcp_server.scripts.generate_embeddings.DenseRetriever')
 def test_generate_embeddings_with_document_details(
@@ -180,7 +180,7 @@ def test_argument_parser_defaults():
 def test_generate_operation_document_happy_path():
     """A happy path test for _generate_operation_document."""
     # Get actual lambda service and list-aliases operation
-    lambda_command = driver._get_command_table()['lambda']
+    lambda_command = get_driver()._get_command_table()['lambda']
     lambda_operations = lambda_command._get_command_table()
     list_aliases_operation = lambda_operations['list-aliases']
 
@@ -203,7 +203,7 @@ def test_generate_operation_document_happy_path():
 
 def test_generate_operation_document_for_custom_service():
     """Test that _generate_operation_document handles custom services."""
-    s3_command = driver._get_command_table()['s3']
+    s3_command = get_driver()._get_command_table()['s3']
     s3_operations = s3_command.subcommand_table
     sync_operation = s3_operations['sync']
 
@@ -218,7 +218,7 @@ def test_generate_operation_document_for_custom_service():
 
 def test_generate_operation_document_for_custom_operation():
     """Test that _generate_operation_document handles custom operations."""
-    cf_command = driver._get_command_table()['cloudformation']
+    cf_command = get_driver()._get_command_table()['cloudformation']
     cf_operations = cf_command._get_command_table()
     package_operation = cf_operations['deploy']
 
@@ -238,7 +238,7 @@ def test_generate_operation_document_for_custom_operation():
 
 def test_generate_operation_document_for_custom_subcommand():
     """Test that _generate_operation_document handles custom subcommands."""
-    lambda_command = driver._get_command_table()['lambda']
+    lambda_command = get_driver()._get_command_table()['lambda']
     lambda_operations = lambda_command._get_command_table()
     wait_operation = lambda_operations['wait']
 
@@ -252,7 +252,7 @@ def test_generate_operation_document_for_custom_subcommand():
 
 def test_generate_operation_document_for_custom_argument():
     """Test that _generate_operation_document handles custom arguments."""
-    lambda_command = driver._get_command_table()['lambda']
+    lambda_command = get_driver()._get_command_table()['lambda']
     lambda_operations = lambda_command._get_command_table()
     create_function_operation = lambda_operations['create-function']
 
@@ -279,7 +279,7 @@ def test_get_aws_api_documents():
         if k in ['s3', 'cloudformation', 'lambda', 'configure', 'history']
     }
 
-    with patch.object(driver, '_get_command_table', return_value=filtered_table):
+    with patch.object(get_driver(), '_get_command_table', return_value=filtered_table):
         documents = _get_aws_api_documents()
 
     # Group documents by service name
@@ -300,17 +300,17 @@ def test_get_aws_api_documents():
 def test_get_aws_api_documents_ignores_denied_custom_operations():
     """Test _get_aws_api_documents."""
     # Get original command table and filter to only emr
-    original_table = driver._get_command_table()
+    original_table = get_driver()._get_command_table()
     filtered_table = {k: v for k, v in original_table.items() if k in ['emr']}
 
-    with patch.object(driver, '_get_command_table', return_value=filtered_table):
+    with patch.object(get_driver(), '_get_command_table', return_value=filtered_table):
         documents = _get_aws_api_documents()
 
     for doc in documents:
         assert 'aws emr ssh' not in doc['command']
 
 
-@patch('awslabs.aws_api_mcp_server.scripts.generate_embeddings.driver._get_command_table')
+@patch.object(get_driver(), '_get_command_table')
 def test_get_aws_api_documents_unknown_command_type(mock_get_command_table):
     """Test handling of unknown command types."""
     # Mock unknown command type
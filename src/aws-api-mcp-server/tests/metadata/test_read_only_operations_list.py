@@ -1,6 +1,10 @@
+import os
 import pytest
+import requests
+import time
 from awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list import (
     DEFAULT_REQUEST_TIMEOUT,
+    SERVICE_REFERENCE_CACHE_TTL,
     SERVICE_REFERENCE_URL,
     ReadOnlyOperations,
     ServiceReferenceUrlsByService,
@@ -16,6 +20,16 @@ TEST_READ_OPERATION_2 = 'TestReadOperation2'
 TEST_WRITE_OPERATION = 'TestWriteOperation'
 
 
+@pytest.fixture(autouse=True)
+def service_reference_cache_dir(tmp_path):
+    """Fixture isolating the service reference disk cache in a temporary directory."""
+    with patch(
+        'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_CACHE_DIR',
+        tmp_path,
+    ):
+        yield tmp_path
+
+
 @pytest.fixture
 def sample_service_reference_list_response():
     """Fixture providing a sample policy document."""
@@ -71,12 +85,15 @@ def sample_service_reference_response():
     }
 
 
-@patch('requests.get')
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
 def test_read_only_operations_initialization(
     mocked_requests_get, sample_service_reference_list_response
 ):
     """Test ReadOnlyOperations initialization."""
     mocked_service_reference_list_response = MagicMock(spec=Response)
+    mocked_service_reference_list_response.headers = {}
     mocked_service_reference_list_response.json.return_value = (
         sample_service_reference_list_response
     )
@@ -90,16 +107,20 @@ def test_read_only_operations_initialization(
     )
 
 
-@patch('requests.get')
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
 def test_read_only_operations_has_method_missing_service(
     mocked_requests_get, sample_service_reference_list_response, sample_service_reference_response
 ):
     """Test the has method of ReadOnlyOperations when the provided service is missing."""
     mocked_service_reference_list_response = MagicMock(spec=Response)
+    mocked_service_reference_list_response.headers = {}
     mocked_service_reference_list_response.json.return_value = (
         sample_service_reference_list_response
     )
     mocked_service_reference_response = MagicMock(spec=Response)
+    mocked_service_reference_response.headers = {}
     mocked_service_reference_response.json.return_value = sample_service_reference_response
     mocked_requests_get.side_effect = [
         mocked_service_reference_list_response,
@@ -120,16 +141,20 @@ def test_read_only_operations_has_method_missing_service(
     )
 
 
-@patch('requests.get')
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
 def test_read_only_operations_has_method_second_call_for_service_queries_local_cache(
     mocked_requests_get, sample_service_reference_list_response, sample_service_reference_response
 ):
     """Test the has method of ReadOnlyOperations when the provided service is available."""
     mocked_service_reference_list_response = MagicMock(spec=Response)
+    mocked_service_reference_list_response.headers = {}
     mocked_service_reference_list_response.json.return_value = (
         sample_service_reference_list_response
     )
     mocked_service_reference_response = MagicMock(spec=Response)
+    mocked_service_reference_response.headers = {}
     mocked_service_reference_response.json.return_value = sample_service_reference_response
     mocked_requests_get.side_effect = [
         mocked_service_reference_list_response,
@@ -153,12 +178,15 @@ def test_read_only_operations_has_method_second_call_for_service_queries_local_c
     assert mocked_requests_get.call_count == 2
 
 
-@patch('requests.get')
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
 def test_read_only_operations_has_method_error(
     mocked_requests_get, sample_service_reference_list_response
 ):
     """Test the has method of ReadOnlyOperations when the service reference API call throws an error."""
     mocked_response = MagicMock(spec=Response)
+    mocked_response.headers = {}
     mocked_response.json.return_value = sample_service_reference_list_response
     mocked_requests_get.side_effect = [
         mocked_response,
@@ -179,7 +207,9 @@ def test_read_only_operations_has_method_error(
     )
 
 
-@patch('requests.get')
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
 def test_service_reference_urls_by_service_error(mocked_requests_get):
     """Test ServiceReferenceUrlsByService initialization when the service reference API call throws an error."""
     mocked_requests_get.side_effect = RuntimeError('Error while calling service reference API')
@@ -191,6 +221,155 @@ def test_service_reference_urls_by_service_error(mocked_requests_get):
     )
 
 
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
+def test_service_reference_urls_by_service_uses_disk_cache(
+    mocked_requests_get, sample_service_reference_list_response
+):
+    """Test ServiceReferenceUrlsByService reads a fresh disk cache without a request."""
+    mocked_response = MagicMock(spec=Response)
+    mocked_response.headers = {'ETag': '"v1"'}
+    mocked_response.json.return_value = sample_service_reference_list_response
+    mocked_requests_get.return_value = mocked_response
+
+    assert ServiceReferenceUrlsByService() == {TEST_SERVICE: TEST_URL}
+    assert ServiceReferenceUrlsByService() == {TEST_SERVICE: TEST_URL}
+    mocked_requests_get.assert_called_once_with(
+        SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT
+    )
+
+
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
+def test_service_reference_urls_by_service_revalidates_stale_cache(
+    mocked_requests_get, service_reference_cache_dir, sample_service_reference_list_response
+):
+    """Test ServiceReferenceUrlsByService revalidates a stale disk cache with its ETag."""
+    mocked_response = MagicMock(spec=Response)
+    mocked_response.headers = {'ETag': '"v1"'}
+    mocked_response.json.return_value = sample_service_reference_list_response
+    mocked_not_modified_response = MagicMock(spec=Response)
+    mocked_not_modified_response.status_code = 304
+    mocked_requests_get.side_effect = [mocked_response, mocked_not_modified_response]
+
+    ServiceReferenceUrlsByService()
+    stale_time = time.time() - SERVICE_REFERENCE_CACHE_TTL - 1
+    for cache_file in service_reference_cache_dir.iterdir():
+        os.utime(cache_file, (stale_time, stale_time))
+
+    assert ServiceReferenceUrlsByService() == {TEST_SERVICE: TEST_URL}
+    mocked_requests_get.assert_called_with(
+        SERVICE_REFERENCE_URL,
+        headers={'If-None-Match': '"v1"'},
+        timeout=DEFAULT_REQUEST_TIMEOUT,
+    )
+    mocked_not_modified_response.json.assert_not_called()
+
+
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
+def test_service_reference_urls_by_service_revalidates_future_dated_cache(
+    mocked_requests_get, service_reference_cache_dir, sample_service_reference_list_response
+):
+    """Test ServiceReferenceUrlsByService does not trust a cache modified in the future."""
+    mocked_response = MagicMock(spec=Response)
+    mocked_response.headers = {'ETag': '"v1"'}
+    mocked_response.json.return_value = sample_service_reference_list_response
+    mocked_not_modified_response = MagicMock(spec=Response)
+    mocked_not_modified_response.status_code = 304
+    mocked_requests_get.side_effect = [mocked_response, mocked_not_modified_response]
+
+    ServiceReferenceUrlsByService()
+    future_time = time.time() + SERVICE_REFERENCE_CACHE_TTL
+    for cache_file in service_reference_cache_dir.iterdir():
+        os.utime(cache_file, (future_time, future_time))
+
+    assert ServiceReferenceUrlsByService() == {TEST_SERVICE: TEST_URL}
+    assert mocked_requests_get.call_count == 2
+
+
+@pytest.mark.parametrize(
+    'revalidation_outcome',
+    [requests.ConnectionError('Network is unreachable'), 503],
+)
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
+def test_service_reference_urls_by_service_serves_stale_cache_when_revalidation_fails(
+    mocked_requests_get,
+    revalidation_outcome,
+    service_reference_cache_dir,
+    sample_service_reference_list_response,
+):
+    """Test ServiceReferenceUrlsByService falls back to a stale disk cache it cannot revalidate."""
+    mocked_response = MagicMock(spec=Response)
+    mocked_response.headers = {'ETag': '"v1"'}
+    mocked_response.json.return_value = sample_service_reference_list_response
+    if isinstance(revalidation_outcome, Exception):
+        mocked_requests_get.side_effect = [mocked_response, revalidation_outcome]
+    else:
+        mocked_error_response = MagicMock(spec=Response)
+        mocked_error_response.status_code = revalidation_outcome
+        mocked_error_response.ok = False
+        mocked_requests_get.side_effect = [mocked_response, mocked_error_response]
+
+    ServiceReferenceUrlsByService()
+    stale_time = time.time() - SERVICE_REFERENCE_CACHE_TTL - 1
+    for cache_file in service_reference_cache_dir.iterdir():
+        os.utime(cache_file, (stale_time, stale_time))
+
+    assert ServiceReferenceUrlsByService() == {TEST_SERVICE: TEST_URL}
+    assert mocked_requests_get.call_count == 2
+
+
+@pytest.mark.parametrize('cache_content', ['[1, 2]', '{"etag": "\\"v1\\""}', '"document"'])
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
+def test_service_reference_urls_by_service_ignores_malformed_cache(
+    mocked_requests_get,
+    cache_content,
+    service_reference_cache_dir,
+    sample_service_reference_list_response,
+):
+    """Test ServiceReferenceUrlsByService refetches a cache entry that is not a cached document."""
+    mocked_response = MagicMock(spec=Response)
+    mocked_response.headers = {'ETag': '"v1"'}
+    mocked_response.json.return_value = sample_service_reference_list_response
+    mocked_requests_get.return_value = mocked_response
+
+    ServiceReferenceUrlsByService()
+    for cache_file in service_reference_cache_dir.iterdir():
+        cache_file.write_text(cache_content)
+
+    assert ServiceReferenceUrlsByService() == {TEST_SERVICE: TEST_URL}
+    mocked_requests_get.assert_called_with(SERVICE_REFERENCE_URL, timeout=DEFAULT_REQUEST_TIMEOUT)
+    assert mocked_requests_get.call_count == 2
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX permissions only')
+@patch(
+    'awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list.SERVICE_REFERENCE_SESSION.get'
+)
+def test_service_reference_urls_by_service_ignores_shared_cache_dir(
+    mocked_requests_get, service_reference_cache_dir, sample_service_reference_list_response
+):
+    """Test ServiceReferenceUrlsByService neither reads nor writes a cache others can write to."""
+    mocked_response = MagicMock(spec=Response)
+    mocked_response.headers = {}
+    mocked_response.json.return_value = sample_service_reference_list_response
+    mocked_requests_get.return_value = mocked_response
+    service_reference_cache_dir.chmod(0o777)
+
+    assert ServiceReferenceUrlsByService() == {TEST_SERVICE: TEST_URL}
+    assert ServiceReferenceUrlsByService() == {TEST_SERVICE: TEST_URL}
+    assert mocked_requests_get.call_count == 2
+    assert not any(service_reference_cache_dir.iterdir())
+
+
 def test_read_only_operations_has_method_custom_operation():
     """Test the has method of ReadOnlyOperations with custom operations."""
     operations = ReadOnlyOperations({})
@@ -0,0 +1,32 @@
+import gc
+import weakref
+from awslabs.aws_api_mcp_server.core.parser.interpretation import CLIENT_CACHE_SIZE, _get_client
+
+
+def test_get_paginator_reuses_paginators_of_cached_client():
+    """Test that a cached client builds each paginator only once."""
+    _get_client.cache_clear()
+    cached_client = _get_client('s3', 'AKIA', 'secret', None, 'us-east-1')
+
+    paginator = cached_client.get_paginator('list_objects_v2')
+
+    assert _get_client('s3', 'AKIA', 'secret', None, 'us-east-1') is cached_client
+    assert cached_client.get_paginator('list_objects_v2') is paginator
+    _get_client.cache_clear()
+
+
+def test_evicting_client_releases_its_paginators():
+    """Test that a client evicted from the cache is freed together with its paginators."""
+    _get_client.cache_clear()
+    cached_client = _get_client('s3', 'expired', 'secret', 'token', 'us-east-1')
+    client_ref = weakref.ref(cached_client.client)
+    paginator_ref = weakref.ref(cached_client.get_paginator('list_objects_v2'))
+    del cached_client
+
+    for index in range(CLIENT_CACHE_SIZE):
+        _get_client('s3', f'rotated-{index}', 'secret', 'token', 'us-east-1')
+    gc.collect()
+
+    assert client_ref() is None
+    assert paginator_ref() is None
+    _get_client.cache_clear()
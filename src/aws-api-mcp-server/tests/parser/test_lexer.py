@@ -16,6 +16,15 @@ from awslabs.aws_api_mcp_server.core.parser.lexer import split_cli_command
             'aws cloud9 list-environments --endpoint http://a.txt',
             ['aws', 'cloud9', 'list-environments', '--endpoint', 'http://a.txt'],
         ),
+        (
+            'aws s3api list-buckets --query "Buckets[?Name==\'my bucket\'].Name"',
+            ['aws', 's3api', 'list-buckets', '--query', "Buckets[?Name=='my bucket'].Name"],
+        ),
+        (
+            'aws ssm get-parameter --name=\'/a b\'"/c \\"d\\""\\ e',
+            ['aws', 'ssm', 'get-parameter', '--name=/a b/c "d" e'],
+        ),
+        ("aws s3 ls ''", ['aws', 's3', 'ls', '']),
     ],
 )
 def test_split_cli_command_successfully(command, expected_tokens):
@@ -32,6 +41,7 @@ def test_split_cli_command_successfully(command, expected_tokens):
         ('', CliParsingError, None),
         ('ecs rm', CliParsingError, 'The provided CLI command is not an AWS command'),
         ('aws s3 "', CliParsingError, 'No closing quotation'),
+        ('aws s3 ls \\', CliParsingError, 'No escaped character'),
     ],
 )
 def test_split_cli_command_unsuccessfully(command, error, error_args):
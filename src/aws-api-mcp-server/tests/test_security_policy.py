@@ -677,9 +677,7 @@ def test_check_security_policy_is_read_only_func_called():
 
         result = check_security_policy(mock_ir, mock_read_only_ops, mock_ctx)
 
-        mock_read_only_ops.has.assert_called_with(
-            service='test-service', operation='test-operation'
-        )
+        mock_read_only_ops.has.assert_called_with('test-service', 'test-operation')
         assert result == PolicyDecision.ALLOW
 
 